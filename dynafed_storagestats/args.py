@@ -5,10 +5,24 @@ parser as sub-parsers. Any new sub-commands should be  a sub-parser.
 
 """
 
-import argparse
 import sys
 
 
+####################
+# Module Variables #
+####################
+
+# Log levels accepted by --loglevel.
+_LOGLEVEL_CHOICES = ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+
+# Sub-commands available and their help shown in the top-level Usage/Help.
+_SUB_COMMANDS_HELP = {
+    'checksums': "Obtain and output object/file checksums..",
+    'reports': "Generate report files.",
+    'stats': "Obtain and output storage stats.",
+}
+
+
 #############
 # Functions #
 #############
@@ -21,12 +35,23 @@ def parse_args():
     argparse object.
 
     """
+    # Imported here as it is only needed when actually parsing the arguments.
+    import argparse
+
     # Get CLI arguments
     args = sys.argv[1:]
 
-    # Initiate parser and subparser objects
+    # Nothing else needs to be parsed when only the version is requested.
+    if args == ['--version']:
+        return argparse.Namespace(version=True)
+
+    # Sub-commands available.
+    _sub_commands = sorted(_SUB_COMMANDS_HELP)
+
+    # Initiate parser and subparser objects. The metavar lists every
+    # sub-command even when only the requested one is built below.
     parser = argparse.ArgumentParser()
-    subparser = parser.add_subparsers()
+    subparser = parser.add_subparsers(metavar='{%s}' % ','.join(_sub_commands))
 
     # Version
     parser.add_argument(
@@ -37,10 +62,25 @@ def parse_args():
         help="Print current installed version."
     )
 
-    # Sub-command options argument sub-parsers
-    add_checksums_subparser(subparser)
-    add_reports_subparser(subparser)
-    add_stats_subparser(subparser)
+    # When only the top-level Usage/Help is printed, the sub-commands' names
+    # and help are all that is shown, so their options are not added.
+    if all(_arg in ('-h', '--help') for _arg in args):
+        for _command in _sub_commands:
+            subparser.add_parser(_command, help=_SUB_COMMANDS_HELP[_command])
+
+        _commands, _sub_args = [], []
+
+    # Sub-command options argument sub-parsers. Only the requested
+    # sub-command's parser is built, unless help is asked for or it is unknown.
+    else:
+        _commands, _sub_args = get_requested_subparsers(args, _sub_commands)
+
+    if 'checksums' in _commands:
+        add_checksums_subparser(subparser, _sub_args)
+    if 'reports' in _commands:
+        add_reports_subparser(subparser, _sub_args)
+    if 'stats' in _commands:
+        add_stats_subparser(subparser)
 
     # Print help if no arguments were passed
     if len(sys.argv) == 1:
@@ -50,6 +90,88 @@ def parse_args():
     return parser.parse_args(args)
 
 
+def get_requested_subparsers(args, commands):
+    """Return which sub-command parsers need to be built to parse args.
+
+    The first argument that is not a flag is the requested sub-command. If it
+    is one of the given commands, only that one is needed. Otherwise, or if
+    help is requested before it, all of them are needed so that the help and
+    error messages list every option.
+
+    Arguments:
+    args -- list of CLI arguments at the sub-command's level.
+    commands -- list of sub-command names available at this level.
+
+    Returns:
+    List of sub-command names to build.
+    List of CLI arguments following the requested sub-command.
+
+    """
+    for _index, _arg in enumerate(args):
+        if _arg in ('-h', '--help'):
+            break
+
+        elif not _arg.startswith('-'):
+            if _arg in commands:
+                return [_arg], args[_index + 1:]
+
+            break
+
+    return commands, []
+
+
+def add_argument_group(parser, title):
+    """Return argument group with the given title to add arguments to.
+
+    Argument groups only change how the help is formatted, so unless help
+    might be requested, the parser itself is returned and the arguments are
+    added to it directly. Parsing the arguments is the same in both cases.
+
+    Arguments:
+    parser -- Object form argparse.ArgumentParser()
+    title -- string with the group's title shown in the help.
+
+    Returns:
+    argparse argument group, or the given parser.
+
+    """
+    if is_help_requested(sys.argv[1:]):
+        return parser.add_argument_group(title)
+
+    else:
+        return parser
+
+
+def is_help_requested(args):
+    """Check whether the CLI arguments might request help to be printed.
+
+    Errs on the side of True, for example for any cluster of short flags
+    containing "h", or when no arguments are given as help is then printed.
+
+    Arguments:
+    args -- list of CLI arguments.
+
+    Returns:
+    Boolean.
+
+    """
+    if not args:
+        return True
+
+    for _arg in args:
+        # Anything after "--" is positional.
+        if _arg == '--':
+            break
+
+        elif _arg.startswith('--h'):
+            return True
+
+        elif _arg.startswith('-') and not _arg.startswith('--') and 'h' in _arg:
+            return True
+
+    return False
+
+
 def add_general_options(parser):
     """Add general optional arguments used by any subcommand.
 
@@ -60,7 +182,7 @@ def add_general_options(parser):
     parser.add_argument(
         '-c', '--config',
         action='store',
-        default=['/etc/ugr/conf.d'],
+        default=('/etc/ugr/conf.d',),
         dest='config_path',
         nargs='*',
         help="Path to UGRs endpoint .conf files or directories. "
@@ -83,17 +205,19 @@ def add_general_options(parser):
     )
 
 
-def add_checksums_subparser(subparser):
+def add_checksums_subparser(subparser, args=()):
     """Add optional arguments for the 'checksums' sub-command.
 
     Arguments:
     subparser -- Object form argparse.ArgumentParser().add_subparsers()
+    args -- CLI arguments following 'checksums'. Used to only build the
+            requested sub-sub-command. All are built if empty.
 
     """
     # Initiate parser.
     parser = subparser.add_parser(
         'checksums',
-        help="Obtain and output object/file checksums.."
+        help=_SUB_COMMANDS_HELP['checksums']
     )
     subparser = parser.add_subparsers()
 
@@ -101,8 +225,12 @@ def add_checksums_subparser(subparser):
     parser.set_defaults(cmd='checksums')
 
     # Add Sub-sub commands
-    add_checkusms_get_subparser(subparser)
-    add_checkusms_put_subparser(subparser)
+    _commands = get_requested_subparsers(args, ['get', 'put'])[0]
+
+    if 'get' in _commands:
+        add_checkusms_get_subparser(subparser)
+    if 'put' in _commands:
+        add_checkusms_put_subparser(subparser)
 
 
 def add_checkusms_get_subparser(subparser):
@@ -125,7 +253,7 @@ def add_checkusms_get_subparser(subparser):
     add_general_options(parser)
 
     # Checksum options
-    group_checksum = parser.add_argument_group("Checksum options. Required!")
+    group_checksum = add_argument_group(parser, "Checksum options. Required!")
     group_checksum.add_argument(
         '-e', '--endpoint',
         action='store',
@@ -161,7 +289,7 @@ def add_checkusms_get_subparser(subparser):
     add_logging_options(parser)
 
     # Output Options
-    group_output = parser.add_argument_group("Output options")
+    group_output = add_argument_group(parser, "Output options")
 
     group_output.add_argument(
         '--stdout',
@@ -192,7 +320,7 @@ def add_checkusms_put_subparser(subparser):
     add_general_options(parser)
 
     # Checksum options
-    group_checksum = parser.add_argument_group("Checksum options. Required!")
+    group_checksum = add_argument_group(parser, "Checksum options. Required!")
     group_checksum.add_argument(
         '--checksum',
         action='store',
@@ -232,7 +360,7 @@ def add_checkusms_put_subparser(subparser):
     add_logging_options(parser)
 
     # Output Options
-    group_output = parser.add_argument_group("Output options")
+    group_output = add_argument_group(parser, "Output options")
 
     group_output.add_argument(
         '--stdout',
@@ -251,7 +379,7 @@ def add_logging_options(parser):
 
     """
     # Logging options
-    group_logging = parser.add_argument_group("Logging options")
+    group_logging = add_argument_group(parser, "Logging options")
     group_logging.add_argument(
         '--logfile',
         action='store',
@@ -270,7 +398,7 @@ def add_logging_options(parser):
     group_logging.add_argument(
         '--loglevel',
         action='store',
-        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+        choices=_LOGLEVEL_CHOICES,
         default='WARNING',
         dest='loglevel',
         help="Set log output level. "
@@ -278,17 +406,46 @@ def add_logging_options(parser):
     )
 
 
-def add_reports_subparser(subparser):
+def add_memcached_options(parser):
+    """Add memcached optional arguments.
+
+    Arguments:
+    parser -- Object form argparse.ArgumentParser()
+
+    """
+    # Memcached Options
+    group_memcached = add_argument_group(parser, "Memcached Options")
+    group_memcached.add_argument(
+        '--memhost',
+        action='store',
+        default='127.0.0.1',
+        dest='memcached_ip',
+        help="IP or hostname of memcached instance."
+             "Default: 127.0.0.1"
+    )
+    group_memcached.add_argument(
+        '--memport',
+        action='store',
+        default='11211',
+        dest='memcached_port',
+        help="Port of memcached instance. "
+             "Default: 11211"
+    )
+
+
+def add_reports_subparser(subparser, args=()):
     """Add optional arguments for the 'reports' sub-command.
 
     Arguments:
     subparser -- Object form argparse.ArgumentParser().add_subparsers()
+    args -- CLI arguments following 'reports'. Used to only build the
+            requested sub-sub-command. All are built if empty.
 
     """
     # Initiate parser.
     parser = subparser.add_parser(
         'reports',
-        help="Generate report files."
+        help=_SUB_COMMANDS_HELP['reports']
     )
     subparser = parser.add_subparsers()
 
@@ -296,8 +453,12 @@ def add_reports_subparser(subparser):
     parser.set_defaults(cmd='reports')
 
     # Add Sub-sub commands
-    add_reports_filelist_subparser(subparser)
-    add_reports_storage_subparser(subparser)
+    _commands = get_requested_subparsers(args, ['filelist', 'storage'])[0]
+
+    if 'filelist' in _commands:
+        add_reports_filelist_subparser(subparser)
+    if 'storage' in _commands:
+        add_reports_storage_subparser(subparser)
 
 
 def add_reports_filelist_subparser(subparser):
@@ -322,7 +483,7 @@ def add_reports_filelist_subparser(subparser):
     parser.add_argument(
         '-e', '--endpoint',
         action='store',
-        default=[],
+        default=(),
         dest='endpoint',
         nargs='*',
         help="Choose endpoint(s) to check. "
@@ -334,7 +495,7 @@ def add_reports_filelist_subparser(subparser):
     add_logging_options(parser)
 
     # Reports options
-    group_reports = parser.add_argument_group("Reports options")
+    group_reports = add_argument_group(parser, "Reports options")
     group_reports.add_argument(
         '--delta',
         action='store',
@@ -354,7 +515,7 @@ def add_reports_filelist_subparser(subparser):
     )
 
     # Output Options
-    group_output = parser.add_argument_group("Output options")
+    group_output = add_argument_group(parser, "Output options")
     # group_output.add_argument(
     #     '--debug',
     #     action='store_true',
@@ -412,7 +573,7 @@ def add_reports_storage_subparser(subparser):
     parser.add_argument(
         '-e', '--endpoint',
         action='store',
-        default=[],
+        default=(),
         dest='endpoint',
         nargs='*',
         help="Choose endpoint(s) to check. "
@@ -424,26 +585,10 @@ def add_reports_storage_subparser(subparser):
     add_logging_options(parser)
 
     # Memcached Options
-    group_memcached = parser.add_argument_group("Memcached Options")
-    group_memcached.add_argument(
-        '--memhost',
-        action='store',
-        default='127.0.0.1',
-        dest='memcached_ip',
-        help="IP or hostname of memcached instance."
-             "Default: 127.0.0.1"
-    )
-    group_memcached.add_argument(
-        '--memport',
-        action='store',
-        default='11211',
-        dest='memcached_port',
-        help="Port of memcached instance. "
-             "Default: 11211"
-    )
+    add_memcached_options(parser)
 
     # Reports options
-    group_reports = parser.add_argument_group("Reports options")
+    group_reports = add_argument_group(parser, "Reports options")
     group_reports.add_argument(
         '-s', '--schema',
         action='store',
@@ -460,7 +605,7 @@ def add_reports_storage_subparser(subparser):
     )
 
     # Output Options
-    group_output = parser.add_argument_group("Output options")
+    group_output = add_argument_group(parser, "Output options")
     # group_output.add_argument(
     #     '--debug',
     #     action='store_true',
@@ -498,7 +643,7 @@ def add_stats_subparser(subparser):
     # Initiate parser.
     parser = subparser.add_parser(
         'stats',
-        help="Obtain and output storage stats."
+        help=_SUB_COMMANDS_HELP['stats']
     )
 
     # Set the sub-command routine to run.
@@ -510,7 +655,7 @@ def add_stats_subparser(subparser):
     parser.add_argument(
         '-e', '--endpoint',
         action='store',
-        default=[],
+        default=(),
         dest='endpoint',
         nargs='*',
         help="Choose endpoint(s) to check. "
@@ -522,26 +667,10 @@ def add_stats_subparser(subparser):
     add_logging_options(parser)
 
     # Memcached Options
-    group_memcached = parser.add_argument_group("Memcached Options")
-    group_memcached.add_argument(
-        '--memhost',
-        action='store',
-        default='127.0.0.1',
-        dest='memcached_ip',
-        help="IP or hostname of memcached instance."
-             "Default: 127.0.0.1"
-    )
-    group_memcached.add_argument(
-        '--memport',
-        action='store',
-        default='11211',
-        dest='memcached_port',
-        help="Port of memcached instance. "
-             "Default: 11211"
-    )
+    add_memcached_options(parser)
 
     # Output Options
-    group_output = parser.add_argument_group("Output options")
+    group_output = add_argument_group(parser, "Output options")
     group_output.add_argument(
         '--debug',
         action='store_true',
@@ -15,6 +15,8 @@ class AzureStorageShare(dynafed_storagestats.base.StorageShare):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """Extend StorageShare class attributes."""
         # First we call the super function to initialize the initial attributes
@@ -43,16 +45,16 @@ class AzureStorageShare(dynafed_storagestats.base.StorageShare):
         self.validate_schema()
 
         # Obtain account name and domain from URN
-        self.uri['account'], self.uri['domain'] = self.uri['netloc'].partition('.')[::2]
+        self.uri['account'], _, self.uri['domain'] = self.uri['netloc'].partition('.')
         self.uri['container'] = self.uri['path'].strip('/')
 
     def get_storagestats(self):
         """Contact endpoint using requested method."""
 
-        if (
-            self.plugin_settings['storagestats.api'].lower() == 'generic'
-            or self.plugin_settings['storagestats.api'].lower() == 'list-blobs'
-        ):
+        # Setting values are already validated to be in lowercase.
+        _api = self.plugin_settings['storagestats.api']
+
+        if _api in ('generic', 'list-blobs'):
             azurehelpers.list_blobs(self)
 
     def get_filelist(self, delta=1, prefix='', report_file='/tmp/filelist_report.txt'):
@@ -1,10 +1,13 @@
 """Helper functions used to contact Azure based API's."""
 
-import datetime
+import functools
 import logging
+import time
 
 from azure.storage.blob.baseblobservice import BaseBlobService
 import azure.common
+import requests
+import requests.adapters
 
 import dynafed_storagestats.exceptions
 import dynafed_storagestats.helpers
@@ -18,11 +21,66 @@ import dynafed_storagestats.time
 # Creating logger
 _logger = logging.getLogger(__name__)
 
+# Maximum number of blobs the Azure API returns per "list_blobs" request.
+_LIST_BLOBS_PAGE_SIZE = 5000
+
+# Number of hosts (Azure accounts) and connections per host kept alive by the
+# shared requests session. Shares are contacted by up to 16 threads at once.
+_POOL_CONNECTIONS = 32
+_POOL_MAXSIZE = 16
+
 
 ##############
 # Functions #
 ##############
 
+@functools.lru_cache(maxsize=32)
+def get_base_blob_service(account_name, account_key):
+    """Return BaseBlobService object for the given Azure storage account.
+
+    Objects are cached so that storage shares in the same account, and
+    repeated requests to them, re-use the same HTTP connections.
+
+    Arguments:
+    account_name -- string with the Azure storage account's name.
+    account_key -- string with the Azure storage account's key.
+
+    Returns:
+    azure.storage.blob.baseblobservice.BaseBlobService object.
+
+    """
+    return BaseBlobService(
+        account_name=account_name,
+        account_key=account_key,
+        # Set to true if using Azurite storage emulator for testing.
+        is_emulated=False,
+        request_session=get_requests_session(),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_requests_session():
+    """Return requests.Session object shared by all BaseBlobService objects.
+
+    The session's connection pools are sized so that the threads contacting
+    the storage shares concurrently do not open and discard extra connections.
+    Retries are left to the Azure SDK's own retry policy.
+
+    Returns:
+    requests.Session object.
+
+    """
+    _session = requests.Session()
+    _adapter = requests.adapters.HTTPAdapter(
+        pool_connections=_POOL_CONNECTIONS,
+        pool_maxsize=_POOL_MAXSIZE,
+    )
+    _session.mount('https://', _adapter)
+    _session.mount('http://', _adapter)
+
+    return _session
+
+
 def list_blobs(storage_share, delta=1, prefix='',
                report_file='/tmp/filelist_report.txt',
                request='storagestats'
@@ -41,23 +99,24 @@ def list_blobs(storage_share, delta=1, prefix='',
     _total_bytes = 0
     _total_files = 0
 
-    _base_blob_service = BaseBlobService(
-        account_name=storage_share.uri['account'],
-        account_key=storage_share.plugin_settings['azure.key'],
-        # Set to true if using Azurite storage emulator for testing.
-        is_emulated=False
-    )
-
+    _account_name = storage_share.uri['account']
+    _api = storage_share.plugin_settings['storagestats.api']
     _container_name = storage_share.uri['container']
     _next_marker = None
-    _timeout = int(storage_share.plugin_settings['conn_timeout'])
+    _mask = dynafed_storagestats.time.get_delta_mask(delta)
+    _timeout = storage_share.plugin_settings['conn_timeout']
+
+    _base_blob_service = get_base_blob_service(
+        _account_name,
+        storage_share.plugin_settings['azure.key']
+    )
 
     _logger.debug(
         "[%s]Requesting storage stats with: URN: %s API Method: %s Account: %s Container: %s",
         storage_share.id, storage_share.uri['url'],
-        storage_share.plugin_settings['storagestats.api'].lower(),
-        storage_share.uri['account'],
-        storage_share.uri['container']
+        _api,
+        _account_name,
+        _container_name
     )
 
     while True:
@@ -65,9 +124,14 @@ def list_blobs(storage_share, delta=1, prefix='',
             _blobs = _base_blob_service.list_blobs(
                 _container_name,
                 marker=_next_marker,
+                # Request one full page per iteration.
+                num_results=_LIST_BLOBS_PAGE_SIZE,
                 timeout=_timeout,
                 prefix=prefix,
             )
+            # Iterating may request more blobs to fill up the page, so it is
+            # done here for any errors to be handled below.
+            _page = list(_blobs)
 
         except azure.common.AzureMissingResourceHttpError as ERR:
             raise dynafed_storagestats.exceptions.ErrorAzureContainerNotFound(
@@ -82,7 +146,7 @@ def list_blobs(storage_share, delta=1, prefix='',
                 error='ConnectionError',
                 status_code="400",
                 debug=str(ERR),
-                api=storage_share.plugin_settings['storagestats.api'],
+                api=_api,
             )
 
         except azure.common.AzureException as ERR:
@@ -101,13 +165,9 @@ def list_blobs(storage_share, delta=1, prefix='',
                     storage_share.stats['bytesused'] = 0
                     break
                 else:
-                    try:
-                        for _blob in _blobs:
-                            _total_bytes += int(_blob.properties.content_length)
-                            _total_files += 1
-                    # Investigate
-                    except azure.common.AzureHttpError:
-                        pass
+                    # The SDK already returns content_length as int.
+                    _total_bytes += sum(_blob.properties.content_length for _blob in _page)
+                    _total_files += len(_page)
 
             elif request == 'filelist':
                 try:  # Make sure we got a list of objects.
@@ -115,20 +175,22 @@ def list_blobs(storage_share, delta=1, prefix='',
                 except AttributeError:
                     break
                 else:
-                    for _blob in _blobs:
-                        # Output files older than the specified delta.
-                        if dynafed_storagestats.time.mask_timestamp_by_delta(_blob.properties.last_modified, delta):
-                            report_file.write("%s\n" % _blob.name)
-                            _total_files += 1
+                    # Output files older than the specified delta. The page
+                    # is encoded and written at once.
+                    report_file.write(
+                        "".join(
+                            "%s\n" % _blob.name for _blob in _page
+                            if _blob.properties.last_modified <= _mask
+                        ).encode('utf-8')
+                    )
 
             # Exit if no "NextMarker" as list is now over.
-            if _next_marker:
-                _next_marker = _blobs.next_marker
-            else:
+            _next_marker = _blobs.next_marker
+            if not _next_marker:
                 break
 
     # Save time when data was obtained.
-    storage_share.stats['endtime'] = int(datetime.datetime.now().timestamp())
+    storage_share.stats['endtime'] = int(time.time())
 
     # Process the result for the storage stats.
     if request == 'storagestats':
@@ -1,7 +1,7 @@
 """Define the base Classes StorageEndpoint and StorageShares."""
 
-import datetime
 import logging
+import time
 
 from urllib.parse import urlsplit
 
@@ -16,6 +16,9 @@ import dynafed_storagestats.exceptions
 # Creating logger
 _logger = logging.getLogger(__name__)
 
+# Values of "boolean" settings that are typecast to False.
+_FALSE_VALUES = ('false', 'no')
+
 
 ############
 # Classes ##
@@ -29,6 +32,13 @@ class StorageEndpoint():
 
     """
 
+    # Instances only hold these attributes, so no per-instance __dict__ is needed.
+    __slots__ = (
+        'interface_type',
+        'storage_shares',
+        'url',
+    )
+
     def __init__(self, url):
         """Create storage_shares and url attributes.
 
@@ -59,6 +69,20 @@ class StorageShare():
 
     """
 
+    # Instances only hold these attributes, so no per-instance __dict__ is needed.
+    __slots__ = (
+        'debug',
+        'id',
+        'plugin',
+        'plugin_settings',
+        'star_fields',
+        'stats',
+        'status',
+        'storageprotocol',
+        'uri',
+        'validators',
+    )
+
     def __init__(self, storage_share):
         """Create attributes from UGR's endpoint settings and defaults.
 
@@ -77,7 +101,7 @@ class StorageShare():
         # We add the url form the conf file to the plugin_settings as the one
         # in the uri attribute below will be modified depending on the
         # StorageShare/endpoint protocol.
-        self.plugin_settings.update({'url': storage_share['url']})
+        self.plugin_settings['url'] = storage_share['url']
 
         # URL split needed to simplify the formation of the form needed to make
         # protocol specific API requests.
@@ -113,7 +137,7 @@ class StorageShare():
             'endtime': 0,
             'filecount': -1,
             'quota': 1000**4,
-            'starttime': int(datetime.datetime.now().timestamp()),
+            'starttime': int(time.time()),
             'check': True, # To flag whether this endpoint should be contacted.
         }
 
@@ -170,7 +194,7 @@ class StorageShare():
 
         _logger.info("[%s]Validating configured settings.", self.id)
 
-        for _setting in self.validators:
+        for _setting, _validator in self.validators.items():
             _logger.debug(
                 "[%s]Validating setting: %s",
                 self.id,
@@ -180,75 +204,77 @@ class StorageShare():
             # First check if the _setting has been defined in the config file..
             # If it is missing, check if it is required to be defined, and exit
             # if true, otherwise set it to the default value and print a warning.
-            try:
-                self.plugin_settings[_setting]
+            if _setting not in self.plugin_settings:
+                if _validator['required']:
+                    ERR = dynafed_storagestats.exceptions.ConfigFileErrorMissingRequiredSetting(
+                        error="MissingRequiredSetting",
+                        setting=_setting,
+                        status_code=_validator['status_code'],
+                    )
 
-            except KeyError:
-                try:
-                    if self.validators[_setting]['required']:
-                        raise dynafed_storagestats.exceptions.ConfigFileErrorMissingRequiredSetting(
-                            error="MissingRequiredSetting",
-                            setting=_setting,
-                            status_code=self.validators[_setting]['status_code'],
-                        )
-
-                    else:
-                        raise dynafed_storagestats.exceptions.ConfigFileWarningMissingSetting(
-                            error="MissingSetting",
-                            setting=_setting,
-                            setting_default=self.validators[_setting]['default'],
-                            status_code=self.validators[_setting]['status_code'],
-                        )
-
-                except dynafed_storagestats.exceptions.ConfigFileErrorMissingRequiredSetting as ERR:
                     # Mark StorageShare/endpoint to be skipped with a reason.
                     self.stats['check'] = 'MissingRequiredSetting'
-                    self.plugin_settings.update({_setting: ''})
+                    self.plugin_settings[_setting] = ''
 
                     _logger.error("[%s]%s", self.id, ERR.debug)
                     self.debug.append("[ERROR]" + ERR.debug)
                     self.status.append("[ERROR]" + ERR.error_code)
 
-                except dynafed_storagestats.exceptions.ConfigFileWarningMissingSetting as WARN:
+                else:
+                    WARN = dynafed_storagestats.exceptions.ConfigFileWarningMissingSetting(
+                        error="MissingSetting",
+                        setting=_setting,
+                        setting_default=_validator['default'],
+                        status_code=_validator['status_code'],
+                    )
+
                     # Set the default value for this setting.
-                    self.plugin_settings.update({_setting: self.validators[_setting]['default']})
+                    self.plugin_settings[_setting] = _validator['default']
 
                     _logger.warning("[%s]%s", self.id, WARN.debug)
                     self.debug.append("[WARNING]" + WARN.debug)
                     self.status.append("[WARNING]" + WARN.error_code)
 
+                continue
+
             # If the _setting has been defined, check against a list of valid
             # plugin_settings if defined. Also, typecast to boolean form those
             # that have the "boolean" key set as true.
-            else:
+            _valid = _validator.get('valid')
+
+            if _valid is not None:
+                if self.plugin_settings[_setting] not in _valid:
+                    # Mark StorageShare/endpoint to be skipped with a reason.
+                    self.stats['check'] = 'InvalidSetting'
+                    raise dynafed_storagestats.exceptions.ConfigFileErrorInvalidSetting(
+                        error="InvalidSetting",
+                        setting=_setting,
+                        status_code=_validator['status_code'],
+                        valid_plugin_settings=_valid
+                    )
+
+                if 'boolean' in _validator:
+                    self.plugin_settings[_setting] = self.plugin_settings[_setting].lower() not in _FALSE_VALUES
+
+            # Typecast to integer those that have the "type" key set as
+            # 'int', so they are not re-cast each time they are used.
+            if _validator.get('type') == 'int':
                 try:
-                    if self.plugin_settings[_setting] not in self.validators[_setting]['valid']:
-                        # Mark StorageShare/endpoint to be skipped with a reason.
-                        self.stats['check'] = 'InvalidSetting'
-                        raise dynafed_storagestats.exceptions.ConfigFileErrorInvalidSetting(
-                            error="InvalidSetting",
-                            setting=_setting,
-                            status_code=self.validators[_setting]['status_code'],
-                            valid_plugin_settings=self.validators[_setting]['valid']
-                        )
-
-                    else:
-                        try:
-                            self.validators[_setting]['boolean']
-
-                        except KeyError:
-                            pass
-
-                        else:
-                            if self.plugin_settings[_setting].lower() == 'false'\
-                            or self.plugin_settings[_setting].lower() == 'no':
-                                self.plugin_settings.update({_setting: False})
-                            else:
-                                self.plugin_settings.update({_setting: True})
-
-                except KeyError:
-                    # The 'valid' key is not required to exist.
-                    pass
+                    self.plugin_settings[_setting] = int(self.plugin_settings[_setting])
+
+                except ValueError:
+                    # Mark StorageShare/endpoint to be skipped with a reason.
+                    self.stats['check'] = 'InvalidSetting'
+                    ERR = dynafed_storagestats.exceptions.ConfigFileErrorInvalidSetting(
+                        error="InvalidSetting",
+                        setting=_setting,
+                        status_code=_validator['status_code'],
+                        valid_plugin_settings='integer'
+                    )
+
+                    _logger.error("[%s]%s", self.id, ERR.debug)
+                    self.debug.append("[ERROR]" + ERR.debug)
+                    self.status.append("[ERROR]" + ERR.error_code)
 
         # If user has specified an SSL CA bundle:
         if self.plugin_settings['ssl_check']:
@@ -1,14 +1,16 @@
 """Functions to deal with reading the configuration files from UGR."""
 
+import collections
+import copy
+import functools
+import importlib
 import logging
 import glob
 import os
+import re
 import sys
 
-from dynafed_storagestats.azure import base as azure
 from dynafed_storagestats.base import StorageShare, StorageEndpoint
-from dynafed_storagestats.dav import base as dav
-from dynafed_storagestats.s3 import base as s3
 import dynafed_storagestats.exceptions
 
 
@@ -19,6 +21,31 @@ import dynafed_storagestats.exceptions
 # Creating logger
 _logger = logging.getLogger(__name__)
 
+# Matches the UGR configuration lines we care about. Either a storage share
+# definition:
+#   glb.locplugin[]: /path/to/plugin.so <ID> <concurrency> <URL>
+# or a plugin setting, where <ID> is '*' for global settings:
+#   locplugin.<ID>.<setting>: <value>
+# It is run over a whole file's contents, so that any other lines, including
+# comments, are skipped by the regex engine. Whitespace is matched with
+# '[ \t]' where '\s' could run into the next line.
+_CONF_LINE_RE = re.compile(
+    r'^[ \t]*(?:glb\.locplugin\[\]:?[ \t]+(?P<plugin>\S+)[ \t]+(?P<id>\S+)[ \t]+\S+[ \t]+(?P<url>\S+)'
+    r'|(?P<key>locplugin\.(?P<locid>[^.:\s]+)\.(?P<setting>[^:\n]+?))[ \t]*:[ \t]*(?P<value>.*?))[ \t]*$',
+    re.MULTILINE
+)
+
+# UGR plugins and the module and name of the StorageShare sub-class used for
+# each. Used by factory().
+_PLUGIN_DICT = {
+    'libugrlocplugin_dav.so': ('dynafed_storagestats.dav.base', 'DAVStorageShare'),
+    'libugrlocplugin_http.so': ('dynafed_storagestats.dav.base', 'DAVStorageShare'),
+    'libugrlocplugin_s3.so': ('dynafed_storagestats.s3.base', 'S3StorageShare'),
+    'libugrlocplugin_azure.so': ('dynafed_storagestats.azure.base', 'AzureStorageShare'),
+    # 'libugrlocplugin_davrucio.so': RucioStorageShare,
+    # 'libugrlocplugin_dmliteclient.so': DMLiteStorageShare,
+}
+
 
 #############
 # Functions #
@@ -28,30 +55,25 @@ def factory(plugin):
     """Return StorageShare sub-class based on the plugin set in UGR's config.
 
     Arguments:
-    plugin -- string to compare against _plugin_dict keys.
+    plugin -- string to compare against _PLUGIN_DICT keys.
 
     Returns:
     StorageShare sub-class object.
 
     """
-    _plugin_dict = {
-        'libugrlocplugin_dav.so': dav.DAVStorageShare,
-        'libugrlocplugin_http.so': dav.DAVStorageShare,
-        'libugrlocplugin_s3.so': s3.S3StorageShare,
-        'libugrlocplugin_azure.so': azure.AzureStorageShare,
-        # 'libugrlocplugin_davrucio.so': RucioStorageShare,
-        # 'libugrlocplugin_dmliteclient.so': DMLiteStorageShare,
-    }
-
-    if plugin in _plugin_dict:
-        return _plugin_dict.get(plugin)
+    try:
+        _module_name, _class_name = _PLUGIN_DICT[plugin]
 
-    else:
+    except KeyError:
         raise dynafed_storagestats.exceptions.UnsupportedPluginError(
             error="UnsupportedPlugin",
             plugin=plugin,
         )
 
+    # Sub-classes are only imported when needed, as the libraries used by
+    # each protocol (boto3, azure-storage...) take long to import.
+    return getattr(importlib.import_module(_module_name), _class_name)
+
 
 def get_conf_files(config_path):
     """Return list of all files "*.conf" found at the path(s) given.
@@ -83,7 +105,7 @@ def get_conf_files(config_path):
     # We add any other files in the path(s) defined by cli.
     for _element in config_path:
         if os.path.isdir(_element):
-            _config_files = _config_files + sorted(glob.glob(_element + "/" + "*.conf"))
+            _config_files = _config_files + sorted(glob.glob(os.path.join(_element, "*.conf")))
 
         elif os.path.isfile(_element):
             _config_files.append(_element)
@@ -121,13 +143,12 @@ def get_storage_endpoints(storage_share_objects):
     """
 
     _storage_endpoints = []
-    _urls_dict = {}
+    _urls_dict = collections.defaultdict(list)
 
     # Populate _urls_dict using storage_share_objects URL's as the keys
     # and each StorageShare as a list under these keys.
 
     for _storage_share_object in storage_share_objects:
-        _urls_dict.setdefault(_storage_share_object.uri['url'], [])
         _urls_dict[_storage_share_object.uri['url']].append(_storage_share_object)
 
     if _urls_dict:
@@ -142,10 +163,10 @@ def get_storage_endpoints(storage_share_objects):
 
     # Generate a StorageEnpoint object from the URL and attach any StorageShares
     # that share this URL.
-    for _url in _urls_dict:
+    for _url, _storage_shares in _urls_dict.items():
         _storage_endpoint = StorageEndpoint(_url)
 
-        for _storage_share in _urls_dict[_url]:
+        for _storage_share in _storage_shares:
             _storage_endpoint.add_storage_share(_storage_share)
 
         _storage_endpoints.append(_storage_endpoint)
@@ -153,7 +174,7 @@ def get_storage_endpoints(storage_share_objects):
     return _storage_endpoints
 
 
-def get_storage_shares(config_path, storage_shares_mask=[]):
+def get_storage_shares(config_path, storage_shares_mask=()):
     """Return list of StorageShare objects from UGR's configuration files.
 
     Arguments:
@@ -180,8 +201,15 @@ def get_storage_shares(config_path, storage_shares_mask=[]):
         sys.exit(1)
 
     # Parse the files for Storage Shares, exit if any issues are detected.
+    # Results are cached until any of the files change, a copy is used as
+    # the StorageShare objects modify their settings.
     try:
-        _storage_shares = parse_conf_files(_config_files, storage_shares_mask)
+        _storage_shares = copy.deepcopy(
+            _parse_conf_files_cached(
+                _get_conf_files_signature(_config_files),
+                tuple(storage_shares_mask)
+            )
+        )
 
     except dynafed_storagestats.exceptions.ConfigFileErrorIDMismatch as ERR:
         _logger.critical("[%s]%s", ERR.storage_share, ERR.debug)
@@ -217,29 +245,29 @@ def get_storage_share_objects(storage_shares):
 
     _storage_share_objects = []
 
-    for _storage_share in storage_shares:
+    for _storage_share in storage_shares.values():
         _logger.debug(
             "[%s]Requesting object class",
-            storage_shares[_storage_share]['id']
+            _storage_share['id']
         )
 
         # Generate StorageShare objects through factory().
         try:
-            _storage_share_object = factory(storage_shares[_storage_share]['plugin'])(storage_shares[_storage_share])
+            _storage_share_object = factory(_storage_share['plugin'])(_storage_share)
             _logger.debug(
                 "[%s]Object class returned: %s",
-                storage_shares[_storage_share]['id'],
+                _storage_share['id'],
                 type(_storage_share_object)
             )
             _logger.debug(
                 "[%s]Object.plugin: %s",
-                storage_shares[_storage_share]['id'],
-                storage_shares[_storage_share]['plugin']
+                _storage_share['id'],
+                _storage_share['plugin']
             )
 
         except dynafed_storagestats.exceptions.UnsupportedPluginError as ERR:
-            _logger.error("[%s]%s", storage_shares[_storage_share]['id'], ERR.debug)
-            _storage_share_object = StorageShare(storage_shares[_storage_share])
+            _logger.error("[%s]%s", _storage_share['id'], ERR.debug)
+            _storage_share_object = StorageShare(_storage_share)
             _storage_share_object.debug.append("[ERROR]" + ERR.debug)
             _storage_share_object.status.append("[ERROR]" + ERR.error_code)
 
@@ -248,7 +276,7 @@ def get_storage_share_objects(storage_shares):
     return _storage_share_objects
 
 
-def parse_conf_files(config_files, storage_shares_mask=[]):
+def parse_conf_files(config_files, storage_shares_mask=()):
     """Return dict for each storage share in passed configuration files.
 
     Extract storage shares/endpoints and their plugin_settings from the given
@@ -280,6 +308,7 @@ def parse_conf_files(config_files, storage_shares_mask=[]):
 
     _storage_shares = {}
     _global_settings = {}
+    _id = None
 
     for _config_file in config_files:
         try:
@@ -290,64 +319,56 @@ def parse_conf_files(config_files, storage_shares_mask=[]):
             )
 
             with open(_config_file, "r") as _file:
-                for _line_number, _line in enumerate(_file):
-                    _line = _line.strip()
-
-                    if not _line.startswith("#"):
-                        if "glb.locplugin[]" in _line:
-                            _plugin, _id, _concurrency, _url = _line.split()[1::]
-                            if _id in storage_shares_mask or len(storage_shares_mask) == 0:
-                                _storage_shares.setdefault(_id, {})
-                                _storage_shares[_id].update({'id': _id.strip()})
-                                _storage_shares[_id].update({'url': _url.strip()})
-                                _storage_shares[_id].update({'plugin': _plugin.split("/")[-1]})
-
-                                _logger.info(
-                                    "Found storage share '%s' using plugin '%s'. "
-                                    "Reading configuration.",
-                                    _storage_shares[_id]['id'], _storage_shares[_id]['plugin']
-                                )
-
-                        elif "locplugin" in _line:
-                            _key, _value = _line.partition(":")[::2]
-                            _locid = _key.split('.')[1]
-
-                            # Match an _id in _locid
-                            if _locid == '*':
-                                # Add any global settings to its own dictionary.
-                                _setting = _key.split('*' + '.')[-1]
-                                _global_settings.update({_setting: _value.strip()})
-                                _logger.info(
-                                    "Found global setting '%s': %s.",
-                                    _key,
-                                    _value
-                                )
-
-                            elif _id == _locid:
-                                if _id in storage_shares_mask or len(storage_shares_mask) == 0:
-                                    _setting = _key.split(_id + '.')[-1]
-                                    _storage_shares.setdefault(_id, {})
-                                    _storage_shares[_id].setdefault('plugin_settings', {})
-                                    _storage_shares[_id]['plugin_settings'].update({_setting: _value.strip()})
-                                    _logger.debug(
-                                        "[%s]Found local ID setting '%s'",
-                                        _locid,
-                                        _key.split(_id + '.')[-1],
-                                    )
-
-                            else:
-                                raise dynafed_storagestats.exceptions.ConfigFileErrorIDMismatch(
-                                    storage_share=_id,
-                                    error="SettingIDMismatch",
-                                    line_number=_line_number,
-                                    config_file=_config_file,
-                                    line=_line.split(":")[0],
-                                )
-
-                        else:
-                            # Ignore any other lines
-                            # print( "I don't know what to do with %s", _line)
-                            pass
+                _data = _file.read()
+
+            for _match in _CONF_LINE_RE.finditer(_data):
+                if _match.group('plugin') is not None:
+                    _id = _match.group('id')
+                    if _id in storage_shares_mask or len(storage_shares_mask) == 0:
+                        _storage_shares.setdefault(_id, {})
+                        _storage_shares[_id]['id'] = _id
+                        _storage_shares[_id]['url'] = _match.group('url')
+                        _storage_shares[_id]['plugin'] = _match.group('plugin').split("/")[-1]
+
+                        _logger.info(
+                            "Found storage share '%s' using plugin '%s'. "
+                            "Reading configuration.",
+                            _storage_shares[_id]['id'], _storage_shares[_id]['plugin']
+                        )
+
+                else:
+                    _key, _locid, _setting, _value = _match.group('key', 'locid', 'setting', 'value')
+
+                    # Match an _id in _locid
+                    if _locid == '*':
+                        # Add any global settings to its own dictionary.
+                        _global_settings[_setting] = _value.strip()
+                        _logger.info(
+                            "Found global setting '%s': %s.",
+                            _key,
+                            _value
+                        )
+
+                    elif _id == _locid:
+                        if _id in storage_shares_mask or len(storage_shares_mask) == 0:
+                            _storage_shares.setdefault(_id, {})
+                            _storage_shares[_id].setdefault('plugin_settings', {})
+                            _storage_shares[_id]['plugin_settings'][_setting] = _value.strip()
+                            _logger.debug(
+                                "[%s]Found local ID setting '%s'",
+                                _locid,
+                                _setting,
+                            )
+
+                    else:
+                        raise dynafed_storagestats.exceptions.ConfigFileErrorIDMismatch(
+                            storage_share=_id,
+                            error="SettingIDMismatch",
+                            # Counted from 0, as enumerate() did per line.
+                            line_number=_data.count('\n', 0, _match.start()),
+                            config_file=_config_file,
+                            line=_key,
+                        )
 
         except UnicodeDecodeError:
             _logger.warning("Cannot parse file, skipping configuration in %s", _config_file)
@@ -358,7 +379,7 @@ def parse_conf_files(config_files, storage_shares_mask=[]):
     for _setting, _value in _global_settings.items():
         for storage_share in _storage_shares:
             if _setting not in _storage_shares[storage_share]['plugin_settings']:
-                _storage_shares[storage_share]['plugin_settings'].update({_setting: _value})
+                _storage_shares[storage_share]['plugin_settings'][_setting] = _value
                 _logger.debug(
                     "[%s]Applying global setting '%s': %s",
                     _storage_shares[storage_share]['id'],
@@ -369,3 +390,45 @@ def parse_conf_files(config_files, storage_shares_mask=[]):
         "Dictionary of storage shares found: %s", _storage_shares
     )
     return _storage_shares
+
+
+def _get_conf_files_signature(config_files):
+    """Return tuple identifying the given files and their current state.
+
+    Arguments:
+    config_files -- List of paths to individual UGR endpoint configuration files.
+
+    Returns:
+    tuple of (path, modification time in ns, size) tuples, one for each file.
+
+    """
+
+    _signature = []
+
+    for _config_file in config_files:
+        _stat = os.stat(_config_file)
+        _signature.append((_config_file, _stat.st_mtime_ns, _stat.st_size))
+
+    return tuple(_signature)
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_conf_files_cached(config_files_signature, storage_shares_mask):
+    """Return parse_conf_files() output, cached by the files' signature.
+
+    As the signature changes when any of the files is modified, the cached
+    result is only re-used while the configuration is unchanged. Callers
+    must not modify the returned dict.
+
+    Arguments:
+    config_files_signature -- tuple obtained from _get_conf_files_signature().
+    storage_shares_mask -- tuple of storage share ID's to parse.
+
+    Returns:
+    dict containing the configured storage shares and their settings.
+
+    """
+
+    _config_files = [_config_file for _config_file, _mtime, _size in config_files_signature]
+
+    return parse_conf_files(_config_files, list(storage_shares_mask))
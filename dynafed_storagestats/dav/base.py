@@ -25,6 +25,8 @@ class DAVStorageShare(dynafed_storagestats.base.StorageShare):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """Extend StorageShare class attributes."""
         # First we call the super function to initialize the initial attributes
@@ -56,16 +58,23 @@ class DAVStorageShare(dynafed_storagestats.base.StorageShare):
         # Invoke the validate_schema() method
         self.validate_schema()
 
+        # Build the URL used to contact the API with the translated schema.
+        self.uri['api_url'] = '{scheme}://{netloc}{path}'.format(
+            scheme=self.uri['scheme'],
+            netloc=self.uri['netloc'],
+            path=self.uri['path']
+        )
+
     def get_storagestats(self):
         """Contact endpoint using requested method."""
 
-        if (
-            self.plugin_settings['storagestats.api'].lower() == 'generic'
-            or self.plugin_settings['storagestats.api'].lower() == 'list-objects'
-        ):
+        # Setting values are already validated to be in lowercase.
+        _api = self.plugin_settings['storagestats.api']
+
+        if _api == 'generic' or _api == 'list-objects':
             davhelpers.list_files(self)
 
-        elif self.plugin_settings['storagestats.api'].lower() == 'rfc4331':
+        elif _api == 'rfc4331':
             davhelpers.rfc4331(self)
 
     def validate_schema(self):
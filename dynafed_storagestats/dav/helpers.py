@@ -1,9 +1,13 @@
 """Helper functions used to contact DAV based API's."""
 
-import datetime
+import functools
 import logging
+import time
 
+from lxml import etree
 import requests
+import requests.adapters
+import urllib3
 
 from dynafed_storagestats import xml
 import dynafed_storagestats.exceptions
@@ -16,6 +20,11 @@ import dynafed_storagestats.exceptions
 # Creating logger
 _logger = logging.getLogger(__name__)
 
+# Number of hosts and connections per host kept alive by each requests
+# session. Shares are contacted by up to 16 threads at once.
+_POOL_CONNECTIONS = 32
+_POOL_MAXSIZE = 16
+
 
 ##############
 # Functions ##
@@ -34,11 +43,7 @@ def list_files(storage_share):
 
     """
 
-    _api_url = '{scheme}://{netloc}{path}'.format(
-        scheme=storage_share.uri['scheme'],
-        netloc=storage_share.uri['netloc'],
-        path=storage_share.uri['path']
-    )
+    _api_url = storage_share.uri['api_url']
 
     _headers = {'Depth': 'infinity'}
     _data = ''
@@ -47,21 +52,23 @@ def list_files(storage_share):
         "[%s]Requesting storage stats with: URN: %s API Method: %s Headers: %s Data: %s",
         storage_share.id,
         _api_url,
-        storage_share.plugin_settings['storagestats.api'].lower(),
+        storage_share.plugin_settings['storagestats.api'],
         _headers,
         _data
     )
 
     # We need to initialize "response" to check if it was successful in the
-    # finally statement.
-    _response = False
+    # finally statement. It is compared to None, as a response object is
+    # False for any error status code, which must be reported and closed too.
+    _response = None
 
     try:
         _response = send_dav_request(
             storage_share,
             _api_url,
             _headers,
-            _data
+            _data,
+            stream=True
         )
 
     except requests.exceptions.InvalidSchema as ERR:
@@ -80,7 +87,8 @@ def list_files(storage_share):
                 storage_share,
                 _api_url,
                 _headers,
-                _data
+                _data,
+                stream=True
             )
 
         except requests.exceptions.SSLError as ERR:
@@ -107,21 +115,46 @@ def list_files(storage_share):
         )
 
     finally:
-        if _response:
-            # Check that we did not get an error code:
-            if _response.status_code < 400:
-                storage_share.stats['bytesused'], storage_share.stats['filecount'] = xml.add_xml_getcontentlength(_response.content)
-                storage_share.stats['quota'] = int(storage_share.plugin_settings['storagestats.quota'])
-                print("quota: %s, type: %s" % (storage_share.stats['quota'], type(storage_share.stats['quota'])))
-                print("bytesused: %s, type: %s" % (storage_share.stats['bytesused'], type(storage_share.stats['bytesused'])))
-                storage_share.stats['bytesfree'] = storage_share.stats['quota'] - storage_share.stats['bytesused']
-
-            else:
-                raise dynafed_storagestats.exceptions.ConnectionError(
-                    error='ConnectionError',
-                    status_code=_response.status_code,
-                    debug=_response.text,
-                )
+        if _response is not None:
+            # The streamed response is closed once processed, even if parsing
+            # it fails, so its connection is not left checked out of the
+            # session's pool. Once fully read it is already back in the pool.
+            try:
+                # Check that we did not get an error code:
+                if _response.status_code < 400:
+                    # Parse the body as it is received instead of loading it all
+                    # in memory, as it can be very large when listing many files.
+                    # The body is read here, outside of the request's error
+                    # handling, so read and parse errors are translated too.
+                    _response.raw.decode_content = True
+                    try:
+                        storage_share.stats['bytesused'], storage_share.stats['filecount'] = xml.add_xml_getcontentlength(_response.raw)
+
+                    except (urllib3.exceptions.HTTPError, requests.exceptions.RequestException, etree.XMLSyntaxError) as ERR:
+                        raise dynafed_storagestats.exceptions.ConnectionError(
+                            error=ERR.__class__.__name__,
+                            status_code="400",
+                            debug=str(ERR),
+                        )
+
+                    storage_share.stats['quota'] = int(storage_share.plugin_settings['storagestats.quota'])
+                    _logger.debug(
+                        "[%s]Quota: %s Bytes used: %s",
+                        storage_share.id,
+                        storage_share.stats['quota'],
+                        storage_share.stats['bytesused']
+                    )
+                    storage_share.stats['bytesfree'] = storage_share.stats['quota'] - storage_share.stats['bytesused']
+
+                else:
+                    raise dynafed_storagestats.exceptions.ConnectionError(
+                        error='ConnectionError',
+                        status_code=_response.status_code,
+                        debug=_response.text,
+                    )
+
+            finally:
+                _response.close()
 
 
 def rfc4331(storage_share):
@@ -137,11 +170,7 @@ def rfc4331(storage_share):
 
     """
 
-    _api_url = '{scheme}://{netloc}{path}'.format(
-        scheme=storage_share.uri['scheme'],
-        netloc=storage_share.uri['netloc'],
-        path=storage_share.uri['path']
-    )
+    _api_url = storage_share.uri['api_url']
 
     _headers = {'Depth': '0'}
     _data = xml.create_rfc4331_request()
@@ -150,7 +179,7 @@ def rfc4331(storage_share):
         "[%s]Requesting storage stats with: URN: %s API Method: %s Headers: %s Data: %s",
         storage_share.id,
         _api_url,
-        storage_share.plugin_settings['storagestats.api'].lower(),
+        storage_share.plugin_settings['storagestats.api'],
         _headers,
         _data
     )
@@ -223,7 +252,38 @@ def rfc4331(storage_share):
                 )
 
 
-def send_dav_request(storage_share, api_url, headers, data):
+@functools.lru_cache(maxsize=32)
+def get_requests_session(cli_certificate, cli_private_key, ssl_check):
+    """Return requests.Session object for the given client certificate.
+
+    Sessions are cached per certificate and CA settings so that the TCP and
+    TLS connections to an endpoint are re-used across requests and storage
+    shares, while each connection is only used with the certificate it was
+    established with. The same settings are still passed to each request, as
+    session defaults would be overridden by the environment's CA bundle.
+
+    Arguments:
+    cli_certificate -- string with path to the client certificate.
+    cli_private_key -- string with path to the client private key.
+    ssl_check -- boolean or string with path to the CA bundle/directory, as
+                 used by requests' "verify".
+
+    Returns:
+    requests.Session object.
+
+    """
+    _session = requests.Session()
+    _adapter = requests.adapters.HTTPAdapter(
+        pool_connections=_POOL_CONNECTIONS,
+        pool_maxsize=_POOL_MAXSIZE,
+    )
+    _session.mount('https://', _adapter)
+    _session.mount('http://', _adapter)
+
+    return _session
+
+
+def send_dav_request(storage_share, api_url, headers, data, stream=False):
     """Contact DAV endpoint with given headers and data.
 
     Arguments:
@@ -233,32 +293,40 @@ def send_dav_request(storage_share, api_url, headers, data):
     data -- string containing data to be sent in the request. RFC4331 method
             uses this to request the stats in XML format. Obtained from:
             dynafed_storagestats.xml.create_rfc4331_request()
+    stream -- boolean. 'True' defers downloading the response body so it can
+              be read incrementally from the response's 'raw' attribute.
 
     Returns:
     String containing endpoint's response.
 
     """
 
-    _response = requests.request(
+    _cli_certificate = storage_share.plugin_settings['cli_certificate']
+    _cli_private_key = storage_share.plugin_settings['cli_private_key']
+    _ssl_check = storage_share.plugin_settings['ssl_check']
+
+    _session = get_requests_session(_cli_certificate, _cli_private_key, _ssl_check)
+
+    _response = _session.request(
         method="PROPFIND",
         url=api_url,
-        cert=(
-            storage_share.plugin_settings['cli_certificate'],
-            storage_share.plugin_settings['cli_private_key']
-        ),
+        cert=(_cli_certificate, _cli_private_key),
         headers=headers,
-        verify=storage_share.plugin_settings['ssl_check'],
+        verify=_ssl_check,
         data=data,
-        timeout=int(storage_share.plugin_settings['conn_timeout'])
+        stream=stream,
+        timeout=storage_share.plugin_settings['conn_timeout']
     )
     # Save time when data was obtained.
-    storage_share.stats['endtime'] = int(datetime.datetime.now().timestamp())
-
-    # Log contents of response
-    _logger.debug(
-        "[%s]Endpoint reply: %s",
-        storage_share.id,
-        _response.text
-    )
+    storage_share.stats['endtime'] = int(time.time())
+
+    # Log contents of response. Streamed responses are not read here as it
+    # would consume them, nor others unless debugging as it decodes the body.
+    if not stream and _logger.isEnabledFor(logging.DEBUG):
+        _logger.debug(
+            "[%s]Endpoint reply: %s",
+            storage_share.id,
+            _response.text
+        )
 
     return _response
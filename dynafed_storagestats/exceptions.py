@@ -159,7 +159,7 @@ class ConfigFileErrorNoConfigFilesFound(ConfigFileError):
     def __init__(self, config_path, error="NoConfigFilesFound", status_code="002", debug=None):
 
         self.message = 'No configuration files found in the path(s): %s' \
-                       % (config_path)
+                       % (config_path,)
         self.debug = debug
 
         super().__init__(error=error, status_code=status_code, message=self.message, debug=self.debug)
@@ -172,7 +172,7 @@ class ConfigFileErrorNoEndpointsFound(ConfigFileError):
     def __init__(self, config_path, error="NoEndpointsFound", status_code="002", debug=None):
 
         self.message = 'No endpoints found in configuration file(s): %s' \
-                       % (config_path)
+                       % (config_path,)
         self.debug = debug
 
         super().__init__(error=error, status_code=status_code, message=self.message, debug=self.debug)
@@ -1,5 +1,6 @@
 """Helper functions used by the other modules."""
 
+import functools
 import logging
 import logging.handlers
 import os
@@ -21,6 +22,23 @@ from dynafed_storagestats import time
 # Creating logger
 _logger = logging.getLogger(__name__)
 
+# Used by convert_size_to_bytes() to split a size into number and unit.
+_SIZE_RE = re.compile(r'^\s*([+-]?\d+)\s*([kmgtp]i?b|b)?\s*$', re.IGNORECASE)
+
+_SIZE_MULTIPLIERS = {
+    'b': 1,
+    'kib': 1024,
+    'mib': 1024**2,
+    'gib': 1024**3,
+    'tib': 1024**4,
+    'pib': 1024**5,
+    'kb': 1000,
+    'mb': 1000**2,
+    'gb': 1000**3,
+    'tb': 1000**4,
+    'pb': 1000**5,
+}
+
 
 #############
 # Functions #
@@ -159,9 +177,12 @@ def check_required_reports_storage_args(args):
         sys.exit(1)
 
 
+@functools.lru_cache(maxsize=256)
 def convert_size_to_bytes(size):
     """Convert given size to bytes.
 
+    Storage shares often use the same quota, so results are cached.
+
     Arguments:
     size - string containing number and optionally storage space unit.
            Examples: 1000, 1KiB, 10tb.
@@ -171,34 +192,16 @@ def convert_size_to_bytes(size):
 
     """
 
-    _multipliers = {
-        'kib': 1024,
-        'mib': 1024**2,
-        'gib': 1024**3,
-        'tib': 1024**4,
-        'pib': 1024**5,
-        'kb': 1000,
-        'mb': 1000**2,
-        'gb': 1000**3,
-        'tb': 1000**4,
-        'pb': 1000**5,
-    }
-
-    for _suffix in _multipliers:
-        if size.lower().endswith(_suffix):
-            return int(size[0:-len(_suffix)]) * _multipliers[_suffix]
-
-    else:
-        if size.lower().endswith('b'):
-            return int(size[0:-1])
-
-    try:
-        return int(size)
+    _match = _SIZE_RE.match(size)
 
-    except ValueError:  # for example "1024x"
+    if not _match:  # for example "1024x"
         print('Malformed input for setting: "storagestats.quota"', file=sys.stderr)
         exit()
 
+    _number, _suffix = _match.groups()
+
+    return int(_number) * _SIZE_MULTIPLIERS[(_suffix or 'b').lower()]
+
 
 def get_currentstats(storage_share_objects, memcached_ip='127.0.0.1', memcached_port='11211'):
     """Obtain StorageShares' status contained in memcached and return as dict.
@@ -536,10 +539,11 @@ def get_dynafed_version():
         stderr=subprocess.STDOUT
     )
 
-    _logger.debug(
-        'RPM query cmd: %s',
-        ' '.join(map(str, _process.args))
-    )
+    if _logger.isEnabledFor(logging.DEBUG):
+        _logger.debug(
+            'RPM query cmd: %s',
+            ' '.join(map(str, _process.args))
+        )
 
     _stdout, _stderr = _process.communicate()
     if _stdout is not None:
@@ -805,7 +809,8 @@ def process_filelist_reports(storage_endpoint, args):
             args.prefix
         )
 
-        with open(_filepath, 'w') as _report_file:
+        # Reports can list millions of files, use a large write buffer.
+        with open(_filepath, 'wb', buffering=1 << 20) as _report_file:
             storage_endpoint.storage_shares[0].get_filelist(
                 delta=args.delta,
                 prefix=args.prefix,
@@ -1,7 +1,7 @@
 """Functions to deal with the formatting and handling  of JSON data."""
 
-import datetime
 import json
+import time
 
 
 #############
@@ -30,45 +30,47 @@ def format_wlcg(storage_endpoints, hostname="localhost"):
     _skeleton = {}
     _storageservice = {}
     _storageendpoints = []
-    _storageshares = []
     _shares = {}
 
     for _storage_endpoint in storage_endpoints:
         for _storage_share in _storage_endpoint.storage_shares:
-            _dynafed_usedsize += _storage_share.stats['bytesused']
-            _dynafed_totalsize += _storage_share.stats['quota']
-            _path = _storage_share.plugin_settings['xlatepfx'].split()[0]
+            _stats = _storage_share.stats
+            _dynafed_usedsize += _stats['bytesused']
+            _dynafed_totalsize += _stats['quota']
+            _path = _storage_share.plugin_settings['xlatepfx'].split(None, 1)[0]
             _storageendpoint = {
                 "name": _storage_share.id,
                 # "id": 'tbd',
                 "endpointurl": _storage_share.uri['url'],
                 "interfacetype": _storage_share.storageprotocol,
-                "timestamp": _storage_share.stats['starttime'],
+                "timestamp": _stats['starttime'],
                 "storage_sharecapacity": {
-                    "totalsize": _storage_share.stats['quota'],
-                    "usedsize": _storage_share.stats['bytesused'],
-                    "numberoffiles": _storage_share.stats['filecount'],
+                    "totalsize": _stats['quota'],
+                    "usedsize": _stats['bytesused'],
+                    "numberoffiles": _stats['filecount'],
                 },
                 "assignedshares": [_path],
             }
             _storageendpoints.append(_storageendpoint)
 
-            if _path in _shares:
-                _shares[_path]['totalsize'] += _storage_share.stats['quota']
-                _shares[_path]['usedsize'] += _storage_share.stats['bytesused']
-                _shares[_path]['assignedendpoints'].append(_storage_share.id)
+            # Look up the share's path once to add to its totals.
+            _share = _shares.get(_path)
+
+            if _share is not None:
+                _share['totalsize'] += _stats['quota']
+                _share['usedsize'] += _stats['bytesused']
+                _share['assignedendpoints'].append(_storage_share.id)
 
             else:
-                _shares.setdefault(_path, {})
                 _shares[_path] = {
-                    "totalsize": _storage_share.stats['quota'],
-                    "usedsize": _storage_share.stats['bytesused'],
+                    "totalsize": _stats['quota'],
+                    "usedsize": _stats['bytesused'],
                     "path": _path,
                     "assignedendpoints": [_storage_share.id]
                 }
 
-    for _share in _shares:
-        _storageshares.append(_shares[_share])
+    # Each path's share totals were complete once all shares were processed.
+    _storageshares = list(_shares.values())
 
     _storageservice = {
         "name": hostname,
@@ -76,7 +78,7 @@ def format_wlcg(storage_endpoints, hostname="localhost"):
         # 'servicetype': "tbd",
         "implementation": "dynafed",
         # 'implementationversion': "tbd",
-        "latestupdate": int(datetime.datetime.now().timestamp()),
+        "latestupdate": int(time.time()),
         "storageservicecapacity": {
             "totalsize": _dynafed_totalsize,
             "usedsize": _dynafed_usedsize,
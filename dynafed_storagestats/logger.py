@@ -1,7 +1,9 @@
 """Helper functions used by the other modules."""
 
+import atexit
 import logging
 import logging.handlers
+import queue
 
 
 #############
@@ -76,7 +78,7 @@ def setup_logger(logfile="/tmp/dynafed_storagestats.log", logid=False, loglevel=
     _log_handler_file.setFormatter(_log_format_file)
 
     # Add the file handler.
-    _logger.addHandler(_log_handler_file)
+    _log_handlers = [_log_handler_file]
 
     # Create STDERR handler if verbose is requested and add it to logger.
     if verbose:
@@ -92,4 +94,14 @@ def setup_logger(logfile="/tmp/dynafed_storagestats.log", logid=False, loglevel=
         log_handler_stderr.setLevel(_num_loglevel)
         log_handler_stderr.setFormatter(log_format_stderr)
         # Add handler
-        _logger.addHandler(log_handler_stderr)
+        _log_handlers.append(log_handler_stderr)
+
+    # The handlers are run by a listener thread fed through a queue, so that
+    # threads logging do not wait on the file/stderr writes. The listener is
+    # stopped at exit, which writes any records still in the queue.
+    _log_queue = queue.Queue()
+    _log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+    _logger.addHandler(logging.handlers.QueueHandler(_log_queue))
@@ -1,7 +1,11 @@
 """Functions to deal with the formatting and handling data to output."""
 
+import io
 import os
 import logging
+import sys
+
+from lxml import etree
 
 import dynafed_storagestats.exceptions
 from dynafed_storagestats import memcache
@@ -112,19 +116,20 @@ def to_plaintext(storage_endpoints, filename, path):
 
         for _storage_endpoint in storage_endpoints:
             for _storage_share in _storage_endpoint.storage_shares:
-                _dynafed_usedsize += _storage_share.stats['bytesused']
-                _dynafed_totalsize += _storage_share.stats['quota']
+                _stats = _storage_share.stats
+                _dynafed_usedsize += _stats['bytesused']
+                _dynafed_totalsize += _stats['quota']
                 output.write(
                     "%s %s %s %s %d %d %d %d %d\n" % (
                         _storage_share.id,
                         _storage_share.uri['url'],
-                        _storage_share.plugin_settings['xlatepfx'].split()[0],
+                        _storage_share.plugin_settings['xlatepfx'].split(None, 1)[0],
                         _storage_share.storageprotocol,
-                        _storage_share.stats['starttime'],
-                        _storage_share.stats['quota'],
-                        _storage_share.stats['bytesused'],
-                        _storage_share.stats['bytesfree'],
-                        _storage_share.stats['filecount'],
+                        _stats['starttime'],
+                        _stats['quota'],
+                        _stats['bytesused'],
+                        _stats['bytesfree'],
+                        _stats['filecount'],
                     )
                 )
 
@@ -144,11 +149,14 @@ def to_xml(storage_endpoints, filename, path):
     # Create output path
     _filepath = path + '/' + filename
 
-    _xml_file = xml.format_StAR(storage_endpoints)
+    _xml_root = xml.format_StAR(storage_endpoints)
 
-    with open(_filepath, 'w') as output:
-        output.write(_xml_file)
-        output.close()
+    etree.ElementTree(_xml_root).write(
+        _filepath,
+        pretty_print=True,
+        encoding='UTF-8',
+        xml_declaration=True
+    )
 
 
 def to_stdout(storage_endpoints, args):
@@ -169,6 +177,14 @@ def to_stdout(storage_endpoints, args):
     args.memcached_port -- memcached instance Port.
 
     """
+    # The flags are the same for every StorageShare.
+    _debug = args.debug
+    _memcached_ip = args.memcached_ip
+    _memcached_port = args.memcached_port
+
+    # Output is gathered and written to stdout at once at the end.
+    _output = io.StringIO()
+
     for _storage_endpoint in storage_endpoints:
         for _storage_share in _storage_endpoint.storage_shares:
             _memcached_index = "Ugrstoragestats_" + _storage_share.id
@@ -176,8 +192,8 @@ def to_stdout(storage_endpoints, args):
             try:
                 _memcached_contents = memcache.get(
                     _memcached_index,
-                    args.memcached_ip,
-                    args.memcached_port
+                    _memcached_ip,
+                    _memcached_port
                 )
 
             except dynafed_storagestats.exceptions.MemcachedIndexError as ERR:
@@ -193,14 +209,18 @@ def to_stdout(storage_endpoints, args):
                   '\n{0:12}{1}'.format('Bytes Free:', _storage_share.stats['bytesfree']),
                   '\n{0:12}{1}'.format('FileCount:', _storage_share.stats['filecount']),
                   '\n{0:12}{1}'.format('Status:', _storage_share.status),
+                  file=_output
                   )
 
             print('\nMemcached:',
                   '\n{0:12}{1}'.format('Index:', _memcached_index),
                   '\n{0:12}{1}'.format('Contents:', _memcached_contents),
+                  file=_output
                   )
 
-            if args.debug:
-                print('\nDebug:')
+            if _debug:
+                print('\nDebug:', file=_output)
                 for _error in _storage_share.debug:
-                    print('{0:12}{1}'.format(' ', _error))
+                    print('{0:12}{1}'.format(' ', _error), file=_output)
+
+    sys.stdout.write(_output.getvalue())
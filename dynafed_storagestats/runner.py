@@ -2,18 +2,27 @@
 
 """Runner to gather storage share information."""
 
-from multiprocessing.dummy import Pool as ThreadPool
+import concurrent.futures
+import logging
+import sys
 
-import dynafed_storagestats.reports
 from dynafed_storagestats import args
-from dynafed_storagestats import configloader
-from dynafed_storagestats import helpers
 from dynafed_storagestats import logger
-from dynafed_storagestats import output
 
 from dynafed_storagestats import __version__
 
 
+####################
+# Module Variables #
+####################
+
+# Creating logger
+_logger = logging.getLogger(__name__)
+
+# Maximum number of threads used to contact storage endpoints concurrently.
+_MAX_THREADS = 16
+
+
 ########
 # Main #
 ########
@@ -57,6 +66,11 @@ def checksums(ARGS):
     ARGS -- argparse object from dynafed_storagestats.args.parse_args()
 
     """
+    # Imported here so only the sub-command being run loads its modules and
+    # the storage backends' libraries they pull in.
+    from dynafed_storagestats import configloader
+    from dynafed_storagestats import helpers
+
     # Check that all required arguments were given.
     helpers.check_required_checksum_args(ARGS)
 
@@ -96,6 +110,11 @@ def reports(ARGS):
     ARGS -- argparse object from dynafed_storagestats.args.parse_args()
 
     """
+    # Imported here so only the sub-command being run loads its modules and
+    # the storage backends' libraries they pull in.
+    import dynafed_storagestats.reports
+    from dynafed_storagestats import configloader
+    from dynafed_storagestats import helpers
 
     if ARGS.sub_cmd == 'filelist':
         # Get list of StorageShare objects from the configuration files.
@@ -117,9 +136,7 @@ def reports(ARGS):
         ]
 
         # Process each storage endpoints' shares using multithreading.
-        # Number of threads to use.
-        _pool = ThreadPool(len(_storage_endpoints_list_and_args_tuple))
-        _pool.starmap(
+        run_threads(
             helpers.process_filelist_reports,
             _storage_endpoints_list_and_args_tuple
         )
@@ -173,9 +190,7 @@ def reports(ARGS):
         ]
 
         # Process each storage endpoints' shares using multithreading.
-        # Number of threads to use.
-        _pool = ThreadPool(len(_storage_endpoints_list_and_args_tuple))
-        _pool.starmap(
+        run_threads(
             helpers.process_storage_reports,
             _storage_endpoints_list_and_args_tuple
         )
@@ -202,6 +217,12 @@ def stats(ARGS):
     ARGS -- argparse object from dynafed_storagestats.args.parse_args()
 
     """
+    # Imported here so only the sub-command being run loads its modules and
+    # the storage backends' libraries they pull in.
+    from dynafed_storagestats import configloader
+    from dynafed_storagestats import helpers
+    from dynafed_storagestats import output
+
     # Get list of StorageShare objects from the configuration files.
     _storage_shares = configloader.get_storage_shares(
         ARGS.config_path,
@@ -241,9 +262,7 @@ def stats(ARGS):
     ]
 
     # Process each storage endpoints' shares using multithreading.
-    # Number of threads to use.
-    pool = ThreadPool(len(storage_endpoints_list_and_args_tuple))
-    pool.starmap(
+    run_threads(
         helpers.process_storagestats,
         storage_endpoints_list_and_args_tuple
     )
@@ -263,6 +282,47 @@ def stats(ARGS):
         output.to_plaintext(storage_endpoints, ARGS.to_plaintext, ARGS.output_path)
 
 
+#############
+# Functions #
+#############
+
+def run_threads(function, args_tuples):
+    """Call function with each tuple of arguments using a pool of threads.
+
+    The pool is bounded by _MAX_THREADS and closed once all calls are done.
+    Any unexpected exception raised by a call is logged once all calls are
+    done, so that it does not stop the results of the others being output.
+
+    Arguments:
+    function -- function to call.
+    args_tuples -- list of tuples, each with the arguments for one call.
+
+    """
+    if not args_tuples:
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(min(len(args_tuples), _MAX_THREADS)) as _executor:
+        _futures = [_executor.submit(function, *_args) for _args in args_tuples]
+
+    for _future in _futures:
+        ERR = _future.exception()
+
+        if ERR is None:
+            continue
+
+        # Let SystemExit and KeyboardInterrupt stop the script as before.
+        if not isinstance(ERR, Exception):
+            raise ERR
+
+        _logger.error(
+            "[%s]Unexpected error: %r",
+            function.__name__,
+            ERR,
+            exc_info=(type(ERR), ERR, ERR.__traceback__)
+        )
+        print("[ERROR][%s]Unexpected error: %r" % (function.__name__, ERR), file=sys.stderr)
+
+
 #############
 # Self-Test #
 #############
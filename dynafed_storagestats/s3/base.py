@@ -28,6 +28,8 @@ class S3StorageShare(dynafed_storagestats.base.StorageShare):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """Extend StorageShare class attributes."""
         # First we call the super function to initialize the initial attributes
@@ -38,7 +40,8 @@ class S3StorageShare(dynafed_storagestats.base.StorageShare):
 
         self.validators.update({
             's3.alternate': {
-                'default': 'false',
+                'boolean': True,
+                'default': False,
                 'required': False,
                 'status_code': '020',
                 'valid': ['true', 'false', 'yes', 'no']
@@ -78,16 +81,13 @@ class S3StorageShare(dynafed_storagestats.base.StorageShare):
         self.validate_schema()
 
         # Obtain bucket name
-        if (
-            self.plugin_settings['s3.alternate'].lower() == 'true'
-            or self.plugin_settings['s3.alternate'].lower() == 'yes'
-        ):
+        if self.plugin_settings['s3.alternate']:
             self.uri['bucket'] = self.uri['path'].rpartition("/")[-1]
 
         else:
-            self.uri['bucket'], self.uri['domain'] = self.uri['netloc'].partition('.')[::2]
+            self.uri['bucket'], _, self.uri['domain'] = self.uri['netloc'].partition('.')
 
-        self.star_fields['storage_share'] = self.uri['bucket']
+        self.star_fields['storageshare'] = self.uri['bucket']
 
     def get_object_checksum(self, hash_type, object_url):
         """Run process to obtain checksum from object's metadata if it exists.
@@ -235,31 +235,31 @@ class S3StorageShare(dynafed_storagestats.base.StorageShare):
     def get_storagestats(self):
         """Contact endpoint using requested method."""
 
+        # Setting values are already validated to be in lowercase.
+        _api = self.plugin_settings['storagestats.api']
+
         # Getting the storage stats CephS3's Admin API
-        if self.plugin_settings['storagestats.api'].lower() == 'ceph-admin':
+        if _api == 'ceph-admin':
             s3helpers.ceph_admin(self)
 
         # Getting the storage stats AWS S3 API
-        # elif self.plugin_settings['storagestats.api'].lower() == 'aws-cloudwatch':
+        # elif _api == 'aws-cloudwatch':
 
         # Getting the storage stats using AWS-Boto3 list-objects API, should
         # work for any compatible S3 endpoint.
-        elif (
-            self.plugin_settings['storagestats.api'].lower() == 'generic'
-            or self.plugin_settings['storagestats.api'].lower() == 'list-objects'
-        ):
+        elif _api == 'generic' or _api == 'list-objects':
             s3helpers.list_objects(self)
 
         # Getting the storage stats using AWS Cloudwatch
-        elif self.plugin_settings['storagestats.api'].lower() == 'cloudwatch':
+        elif _api == 'cloudwatch':
             s3helpers.cloudwatch(self)
 
         # Getting the storage stats from Minio's Prometheus URL
-        elif self.plugin_settings['storagestats.api'].lower() == 'minio_prometheus':
+        elif _api == 'minio_prometheus':
             s3helpers.minio_prometheus(self)
 
         # Getting the storage stats from Minio's V2 Prometheus cluster URL
-        elif self.plugin_settings['storagestats.api'].lower() == 'minio_prometheus_v2':
+        elif _api == 'minio_prometheus_v2':
             s3helpers.minio_prometheus_v2(self)
 
     def get_filelist(self, delta=1, prefix='', report_file='/tmp/filelist_report.txt'):
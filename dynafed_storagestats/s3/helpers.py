@@ -3,6 +3,7 @@
 import datetime
 import logging
 import os
+import time
 
 import boto3
 import botocore.vendored.requests.exceptions as botoRequestsExceptions
@@ -45,11 +46,7 @@ def ceph_admin(storage_share):
     """
 
     # Generate the API's URL to contact.
-    if (
-        storage_share.plugin_settings['s3.alternate'].lower() == 'true'
-        or storage_share.plugin_settings['s3.alternate'].lower() == 'yes'
-    ):
-
+    if storage_share.plugin_settings['s3.alternate']:
         _api_url = '{scheme}://{netloc}/admin/bucket?format=json'.format(
             scheme=storage_share.uri['scheme'],
             netloc=storage_share.uri['netloc']
@@ -80,7 +77,7 @@ def ceph_admin(storage_share):
         "[%s]Requesting storage stats with: URN: %s API Method: %s Payload: %s",
         storage_share.id,
         _api_url,
-        storage_share.plugin_settings['storagestats.api'].lower(),
+        storage_share.plugin_settings['storagestats.api'],
         _payload
     )
 
@@ -95,18 +92,19 @@ def ceph_admin(storage_share):
             params=_payload,
             auth=_auth,
             verify=storage_share.plugin_settings['ssl_check'],
-            timeout=int(storage_share.plugin_settings['conn_timeout'])
+            timeout=storage_share.plugin_settings['conn_timeout']
         )
 
         # Save time when data was obtained.
-        storage_share.stats['endtime'] = int(datetime.datetime.now().timestamp())
+        storage_share.stats['endtime'] = int(time.time())
 
         # Log contents of response
-        _logger.debug(
-            "[%s]Endpoint reply: %s",
-            storage_share.id,
-            _response.text
-        )
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(
+                "[%s]Endpoint reply: %s",
+                storage_share.id,
+                _response.text
+            )
 
     except requests.exceptions.InvalidSchema as ERR:
         raise dynafed_storagestats.exceptions.ConnectionErrorInvalidSchema(
@@ -126,18 +124,19 @@ def ceph_admin(storage_share):
                 params=_payload,
                 auth=_auth,
                 verify=True,
-                timeout=int(storage_share.plugin_settings['conn_timeout'])
+                timeout=storage_share.plugin_settings['conn_timeout']
             )
 
             # Save time when data was obtained.
-            storage_share.stats['endtime'] = int(datetime.datetime.now().timestamp())
+            storage_share.stats['endtime'] = int(time.time())
 
             # Log contents of response
-            _logger.debug(
-                "[%s]Endpoint reply: %s",
-                storage_share.id,
-                _response.text
-            )
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug(
+                    "[%s]Endpoint reply: %s",
+                    storage_share.id,
+                    _response.text
+                )
 
         except requests.exceptions.SSLError as ERR:
             raise dynafed_storagestats.exceptions.ConnectionError(
@@ -171,7 +170,7 @@ def ceph_admin(storage_share):
             # Make sure we get a Bucket Usage information.
             # Fails on empty (in minio) or newly created buckets.
             try:
-                _stats['usage']
+                _usage = _stats['usage']
 
             except KeyError as ERR:
                 raise dynafed_storagestats.exceptions.ErrorS3MissingBucketUsage(
@@ -184,9 +183,10 @@ def ceph_admin(storage_share):
                 # Even if "_stats['usage']" exists, it might be an empty
                 # dict with a new bucket.
                 # We deal with that by setting _stats 0.
-                if _stats['usage']:
-                    storage_share.stats['bytesused'] = int(_stats['usage']['rgw.main']['size_utilized'])
-                    storage_share.stats['filecount'] = int(_stats['usage']['rgw.main']['num_objects'])
+                if _usage:
+                    _rgw_main = _usage['rgw.main']
+                    storage_share.stats['bytesused'] = int(_rgw_main['size_utilized'])
+                    storage_share.stats['filecount'] = int(_rgw_main['num_objects'])
 
                 else:
                     storage_share.stats['bytesused'] = 0
@@ -198,12 +198,14 @@ def ceph_admin(storage_share):
                     storage_share.stats['bytesfree'] = storage_share.stats['quota'] - storage_share.stats['bytesused']
 
                 else:
-                    if _stats['bucket_quota']['enabled'] is True:
-                        storage_share.stats['quota'] = int(_stats['bucket_quota']['max_size'])
+                    _bucket_quota = _stats['bucket_quota']
+
+                    if _bucket_quota['enabled'] is True:
+                        storage_share.stats['quota'] = int(_bucket_quota['max_size'])
                         storage_share.stats['bytesfree'] = storage_share.stats['quota'] - storage_share.stats['bytesused']
 
                     # In case no quota is set in ceph, use default of 1TB.
-                    elif _stats['bucket_quota']['enabled'] is False:
+                    elif _bucket_quota['enabled'] is False:
                         storage_share.stats['quota'] = dynafed_storagestats.helpers.convert_size_to_bytes("1TB")
                         storage_share.stats['bytesfree'] = storage_share.stats['quota'] - storage_share.stats['bytesused']
                         raise dynafed_storagestats.exceptions.CephS3QuotaDisabledWarning(
@@ -281,9 +283,13 @@ def cloudwatch(storage_share):
     _logger.debug(
         "[%s]Requesting storage stats with: API Method: %s",
         storage_share.id,
-        storage_share.plugin_settings['storagestats.api'].lower(),
+        storage_share.plugin_settings['storagestats.api'],
     )
 
+    # All metrics are requested for the same day long window.
+    _end_time = datetime.datetime.utcnow()
+    _start_time = _end_time - datetime.timedelta(days=1)
+
     # Requesting the information for each defined metric.
     for _metric in _metrics:
         _logger.info(
@@ -296,8 +302,8 @@ def cloudwatch(storage_share):
                 Period=_seconds_in_one_day,
                 MetricName=_metric,
                 Namespace=_metrics[_metric]['Namespace'],
-                StartTime=datetime.datetime.utcnow() - datetime.timedelta(days=1),
-                EndTime=datetime.datetime.utcnow(),
+                StartTime=_start_time,
+                EndTime=_end_time,
                 Statistics=_metrics[_metric]['Statistics'],
                 Unit=_metrics[_metric]['Unit'],
                 Dimensions=_metrics[_metric]['Dimensions']
@@ -352,7 +358,7 @@ def cloudwatch(storage_share):
                 ]
 
     # Save the timestamp when data was obtained.
-    storage_share.stats['endtime'] = int(datetime.datetime.now().timestamp())
+    storage_share.stats['endtime'] = int(time.time())
 
     # Save metrics to storage_share.
     storage_share.stats['bytesused'] = int(_metrics['BucketSizeBytes']['Result'])
@@ -397,7 +403,7 @@ def get_cloudwatch_boto_client(storage_share):
         verify=True,
         config=Config(
             signature_version=storage_share.plugin_settings['s3.signature_ver'],
-            connect_timeout=int(storage_share.plugin_settings['conn_timeout']),
+            connect_timeout=storage_share.plugin_settings['conn_timeout'],
             retries=dict(max_attempts=0)
         ),
     )
@@ -416,11 +422,7 @@ def get_s3_boto_client(storage_share):
 
     """
     # Generate the API's URL to contact.
-    if (
-        storage_share.plugin_settings['s3.alternate'].lower() == 'true'
-        or storage_share.plugin_settings['s3.alternate'].lower() == 'yes'
-    ):
-
+    if storage_share.plugin_settings['s3.alternate']:
         _api_url = '{scheme}://{netloc}'.format(
             scheme=storage_share.uri['scheme'],
             netloc=storage_share.uri['netloc']
@@ -446,7 +448,7 @@ def get_s3_boto_client(storage_share):
         verify=storage_share.plugin_settings['ssl_check'],
         config=Config(
             signature_version=storage_share.plugin_settings['s3.signature_ver'],
-            connect_timeout=int(storage_share.plugin_settings['conn_timeout']),
+            connect_timeout=storage_share.plugin_settings['conn_timeout'],
             retries=dict(max_attempts=0)
         ),
     )
@@ -477,6 +479,9 @@ def list_objects(storage_share, delta=1, prefix='',
     _total_bytes = 0
     _total_files = 0
 
+    # Files older than this are output in the filelist.
+    _mask = dynafed_storagestats.time.get_delta_mask(delta)
+
     # We define the arguments for the API call. Delimiter is set to *
     # to get all keys. This is necessary for AWS to return the "NextMarker"
     # attribute necessary to iterate when there are > 1,000 objects.
@@ -490,7 +495,7 @@ def list_objects(storage_share, delta=1, prefix='',
     #     "[%s]Requesting storage stats with: URN: %s API Method: %s Payload: %s",
     #     storage_share.id,
     #     _connection._endpoint,
-    #     storage_share.plugin_settings['storagestats.api'].lower(),
+    #     storage_share.plugin_settings['storagestats.api'],
     #     _kwargs
     # )
 
@@ -523,14 +528,13 @@ def list_objects(storage_share, delta=1, prefix='',
         if request == 'storagestats':
             try:
                 # Make sure we got a list of objects.
-                _response['Contents']
+                _contents = _response['Contents']
             except KeyError:
                 storage_share.stats['bytesused'] = 0
                 break
             else:
-                for _file in _response['Contents']:
-                    _total_bytes += int(_file['Size'])
-                    _total_files += 1
+                _total_bytes += sum(int(_file['Size']) for _file in _contents)
+                _total_files += len(_contents)
 
         elif request == 'filelist':
             try:
@@ -539,15 +543,15 @@ def list_objects(storage_share, delta=1, prefix='',
             except KeyError:
                 break
             else:
-                for _file in _response['Contents']:
-                    # Output files older than the specified delta.
-                    if dynafed_storagestats.time.mask_timestamp_by_delta(_file['LastModified'], delta):
-                        # Remove the prefix:
-                        _filepath = os.path.relpath(_file['Key'], prefix)
-                        # Write to file
-                        report_file.write("%s\n" % _filepath)
-                        # File counter
-                        _total_files += 1
+                # Output files older than the specified delta, with the
+                # prefix removed. The page is encoded and written at once.
+                report_file.write(
+                    "".join(
+                        "%s\n" % os.path.relpath(_file['Key'], prefix)
+                        for _file in _response['Contents']
+                        if _file['LastModified'] <= _mask
+                    ).encode('utf-8')
+                )
 
         # Exit if no "NextMarker" as list is now over.
         try:
@@ -556,7 +560,7 @@ def list_objects(storage_share, delta=1, prefix='',
             break
 
     # Save time when data was obtained.
-    storage_share.stats['endtime'] = int(datetime.datetime.now().timestamp())
+    storage_share.stats['endtime'] = int(time.time())
 
     # Process the result for the storage stats.
     if request == 'storagestats':
@@ -613,18 +617,19 @@ def minio_prometheus(storage_share):
             method="GET",
             url=_api_url,
             verify=storage_share.plugin_settings['ssl_check'],
-            timeout=int(storage_share.plugin_settings['conn_timeout'])
+            timeout=storage_share.plugin_settings['conn_timeout']
         )
 
         # Save time when data was obtained.
-        storage_share.stats['endtime'] = int(datetime.datetime.now().timestamp())
+        storage_share.stats['endtime'] = int(time.time())
 
         # Log contents of response
-        _logger.debug(
-            "[%s]Endpoint reply: %s",
-            storage_share.id,
-            _response.text
-        )
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(
+                "[%s]Endpoint reply: %s",
+                storage_share.id,
+                _response.text
+            )
 
     except requests.exceptions.InvalidSchema as ERR:
         raise dynafed_storagestats.exceptions.ConnectionErrorInvalidSchema(
@@ -642,18 +647,19 @@ def minio_prometheus(storage_share):
                 method="GET",
                 url=_api_url,
                 verify=storage_share.plugin_settings['ssl_check'],
-                timeout=int(storage_share.plugin_settings['conn_timeout'])
+                timeout=storage_share.plugin_settings['conn_timeout']
             )
 
             # Save time when data was obtained.
-            storage_share.stats['endtime'] = int(datetime.datetime.now().timestamp())
+            storage_share.stats['endtime'] = int(time.time())
 
             # Log contents of response
-            _logger.debug(
-                "[%s]Endpoint reply: %s",
-                storage_share.id,
-                _response.text
-            )
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug(
+                    "[%s]Endpoint reply: %s",
+                    storage_share.id,
+                    _response.text
+                )
 
         except requests.exceptions.SSLError as ERR:
             raise dynafed_storagestats.exceptions.ConnectionError(
@@ -720,9 +726,6 @@ def minio_prometheus_v2(storage_share):
     storage_share -- dynafed_storagestats StorageShare object.
 
     """
-    # Creating logger
-    _logger = logging.getLogger(__name__)
-
     # Generate the URL to contact
     _api_url = '{scheme}://{netloc}/minio/v2/metrics/cluster'.format(
         scheme=storage_share.uri['scheme'],
@@ -738,18 +741,19 @@ def minio_prometheus_v2(storage_share):
             method="GET",
             url=_api_url,
             verify=storage_share.plugin_settings['ssl_check'],
-            timeout=int(storage_share.plugin_settings['conn_timeout'])
+            timeout=storage_share.plugin_settings['conn_timeout']
         )
 
         # Save time when data was obtained.
-        storage_share.stats['endtime'] = int(datetime.datetime.now().timestamp())
+        storage_share.stats['endtime'] = int(time.time())
 
         # Log contents of response
-        _logger.debug(
-            "[%s]Endpoint reply: %s",
-            storage_share.id,
-            _response.text
-        )
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(
+                "[%s]Endpoint reply: %s",
+                storage_share.id,
+                _response.text
+            )
 
     except requests.exceptions.InvalidSchema as ERR:
         raise dynafed_storagestats.exceptions.ConnectionErrorInvalidSchema(
@@ -767,18 +771,19 @@ def minio_prometheus_v2(storage_share):
                 method="GET",
                 url=_api_url,
                 verify=storage_share.plugin_settings['ssl_check'],
-                timeout=int(storage_share.plugin_settings['conn_timeout'])
+                timeout=storage_share.plugin_settings['conn_timeout']
             )
 
             # Save time when data was obtained.
-            storage_share.stats['endtime'] = int(datetime.datetime.now().timestamp())
+            storage_share.stats['endtime'] = int(time.time())
 
             # Log contents of response
-            _logger.debug(
-                "[%s]Endpoint reply: %s",
-                storage_share.id,
-                _response.text
-            )
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug(
+                    "[%s]Endpoint reply: %s",
+                    storage_share.id,
+                    _response.text
+                )
 
         except requests.exceptions.SSLError as ERR:
             raise dynafed_storagestats.exceptions.ConnectionError(
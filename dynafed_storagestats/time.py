@@ -31,27 +31,39 @@ def is_later(timestamp, period):
         return False
 
 
-def mask_timestamp_by_delta(timestamp, delta=0):
-    """Return false for timestamps later than the masking delta in days (UTC).
+def get_delta_mask(delta=0):
+    """Return aware datetime object of the masking delta in days (UTC).
 
-    Checks if the timestamp given is later than the current time +/- the
-    delta given in days. When delta == 0, it uses the current date, but when
-    delta != 0 the current date is normalized to today at 00:00 UTC before
-    calculating the mask.
+    When delta == 0, it uses the current date, but when delta != 0 the current
+    date is normalized to today at 00:00 UTC before calculating the mask.
+    Callers checking many timestamps should obtain the mask once and compare
+    against it directly.
 
     Attributes:
-    timestamp -- datetime aware time object.
     delta -- integer.
 
     """
 
     if delta == 0:
-        _mask = now_in_utc()
+        return now_in_utc()
     else:
-        _mask = now_in_utc().replace(hour=0, minute=0, second=0, microsecond=0) \
+        return now_in_utc().replace(hour=0, minute=0, second=0, microsecond=0) \
             - datetime.timedelta(days=delta)
 
-    if timestamp > _mask:
+
+def mask_timestamp_by_delta(timestamp, delta=0):
+    """Return false for timestamps later than the masking delta in days (UTC).
+
+    Checks if the timestamp given is later than the current time +/- the
+    delta given in days. See get_delta_mask() for how the mask is calculated.
+
+    Attributes:
+    timestamp -- datetime aware time object.
+    delta -- integer.
+
+    """
+
+    if timestamp > get_delta_mask(delta):
         return False
     else:
         return True
@@ -1,7 +1,6 @@
 """Functions to deal with the formatting and handling  of XML data."""
 
-import copy
-import datetime
+import functools
 import time
 
 import uuid
@@ -12,19 +11,34 @@ from lxml import etree
 import dynafed_storagestats.exceptions
 
 
+####################
+# Module Variables #
+####################
+
+# StAR storage record namespace, the prefix for its tag names and its nsmap.
+_SR_NAMESPACE = "http://eu-emi.eu/namespaces/2011/02/storagerecord"
+_SR = "{%s}" % _SR_NAMESPACE
+_NSMAP = {"sr": _SR_NAMESPACE}
+
+# Format of the timestamps in StAR records.
+_STAR_TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
 #############
 # Functions #
 #############
 
 def add_xml_getcontentlength(content):
-    """Sum contentlength attribute of all files in content string.
+    """Sum contentlength attribute of all files in content stream.
 
-    Iterates and sums through all the "contentlength sub-elements" returning the
-    total byte count.
+    Incrementally parses the content and sums through all the "contentlength
+    sub-elements" returning the total byte count. Each "response" element is
+    discarded once processed so memory usage does not grow with the number of
+    files listed.
 
     Arguments:
-    content -- string containing endpoint's response in XML format. Generated by
-               functions in dynafed_storagestats.dav.helpers.
+    content -- file-like object containing endpoint's response in XML format.
+               Generated by functions in dynafed_storagestats.dav.helpers.
 
     Returns:
     _bytesused -- int representing sum of all files' sizes.
@@ -32,18 +46,31 @@ def add_xml_getcontentlength(content):
 
     """
 
-    _xml = etree.fromstring(content)
     _bytesused = 0
     _filecount = 0
 
-    for _tags in _xml.iter('{DAV:}getcontentlength'):
-        if isinstance(_tags.text, str):
-            _bytesused += int(_tags.text)
-            _filecount += 1
+    _context = etree.iterparse(
+        content,
+        tag=('{DAV:}getcontentlength', '{DAV:}response'),
+        huge_tree=True,
+    )
+
+    for _event, _element in _context:
+        if _element.tag == '{DAV:}getcontentlength':
+            if _element.text:
+                _bytesused += int(_element.text)
+                _filecount += 1
+
+        else:
+            # Free the already processed "response" elements.
+            _element.clear()
+            while _element.getprevious() is not None:
+                del _element.getparent()[0]
 
     return (_bytesused, _filecount)
 
 
+@functools.lru_cache(maxsize=1)
 def create_rfc4331_request():
     """Create XML RFC4331 request.
 
@@ -51,6 +78,8 @@ def create_rfc4331_request():
     For more information:
     https://tools.ietf.org/html/rfc4331
 
+    The request is always the same, so it is only built once and cached.
+
     Returns:
     String in XML format.
 
@@ -78,38 +107,49 @@ def format_StAR(storage_endpoints):
     storage_endpoints -- List of dynafed_storagestats StorageEndpoint objects.
 
     Returns:
-    String in XML format.
+    lxml.etree.Element "StorageUsageRecords" root containing every record.
 
     """
-    SR_namespace = "http://eu-emi.eu/namespaces/2011/02/storagerecord"
-    SR = "{%s}" % SR_namespace
-    NSMAP = {"sr": SR_namespace}
-    xmlroot = etree.Element(SR + "StorageUsageRecords", nsmap=NSMAP)
+    xmlroot = etree.Element(_SR + "StorageUsageRecords", nsmap=_NSMAP)
+
+    # All records are created now, so the timestamp is only formatted once.
+    create_time = time.strftime(_STAR_TIME_FORMAT, time.gmtime())
+
+    # Namespaced tag and attribute names are the same for every record.
+    record_tag = _SR + 'StorageUsageRecord'
+    record_identity_tag = _SR + 'RecordIdentity'
+    create_time_attr = _SR + "createTime"
+    record_id_attr = _SR + "recordId"
+    storage_share_tag = _SR + "StorageShare"
+    storage_system_tag = _SR + "StorageSystem"
+    start_time_tag = _SR + "StartTime"
+    end_time_tag = _SR + "EndTime"
+    file_count_tag = _SR + "FileCount"
+    capacity_used_tag = _SR + "ResourceCapacityUsed"
+    capacity_allocated_tag = _SR + "ResourceCapacityAllocated"
 
     for endpoint in storage_endpoints:
         for share in endpoint.storage_shares:
-            data = etree.Element(SR + "StorageUsageRecords", nsmap=NSMAP)
-
             # update XML
-            rec = etree.SubElement(xmlroot, SR + 'StorageUsageRecord')
-            rid = etree.SubElement(rec, SR + 'RecordIdentity')
-            rid.set(SR + "createTime", time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(datetime.datetime.now().timestamp())))
+            rec = etree.SubElement(xmlroot, record_tag)
+            rid = etree.SubElement(rec, record_identity_tag)
+            rid.set(create_time_attr, create_time)
 
             # StAR StorageShare field (Optional)
-            if share.star_fields['storage_share']:
-                sshare = etree.SubElement(rec, SR + "StorageShare")
+            if share.star_fields['storageshare']:
+                sshare = etree.SubElement(rec, storage_share_tag)
                 sshare.text = share.star_fields['storageshare']
 
             # StAR StorageSystem field (Required)
             if share.uri['hostname']:
-                ssys = etree.SubElement(rec, SR + "StorageSystem")
+                ssys = etree.SubElement(rec, storage_system_tag)
                 ssys.text = share.uri['hostname']
 
             # StAR recordID field (Required)
             recid = share.id + "-" + str(uuid.uuid1())
-            rid.set(SR + "recordId", recid)
+            rid.set(record_id_attr, recid)
 
-        #    subjid = etree.SubElement(rec, SR + 'SubjectIdentity')
+        #    subjid = etree.SubElement(rec, _SR + 'SubjectIdentity')
 
         #    if endpoint.group:
         #      grouproles = endpoint.group.split('/')
@@ -119,73 +159,69 @@ def format_StAR(storage_endpoints):
         #      splitroles = tmprl.split('=')
         #      if (len(splitroles) > 1):
         #        role = splitroles[1]
-        #        grp = etree.SubElement(subjid, SR + "GroupAttribute" )
-        #        grp.set( SR + "attributeType", "role" )
+        #        grp = etree.SubElement(subjid, _SR + "GroupAttribute" )
+        #        grp.set( _SR + "attributeType", "role" )
         #        grp.text = role
         #      # Now drop this last token, what remains is the vo identifier
         #      grouproles.pop()
         #
         #    # The voname is the first token
         #    voname = grouproles.pop(0)
-        #    grp = etree.SubElement(subjid, SR + "Group")
+        #    grp = etree.SubElement(subjid, _SR + "Group")
         #    grp.text = voname
         #
         #    # If there are other tokens, they are a subgroup
         #    if len(grouproles) > 0:
         #      subgrp = '/'.join(grouproles)
-        #      grp = etree.SubElement(subjid, SR + "GroupAttribute" )
-        #      grp.set( SR + "attributeType", "subgroup" )
+        #      grp = etree.SubElement(subjid, _SR + "GroupAttribute" )
+        #      grp.set( _SR + "attributeType", "subgroup" )
         #      grp.text = subgrp
         #
         #    if endpoint.user:
-        #      usr = etree.SubElement(subjid, SR + "User")
+        #      usr = etree.SubElement(subjid, _SR + "User")
         #      usr.text = endpoint.user
 
             # StAR Site field (Optional)
             ## Review
             # if endpoint.site:
-            #     st = etree.SubElement(subjid, SR + "Site")
+            #     st = etree.SubElement(subjid, _SR + "Site")
             #     st.text = endpoint.site
 
             # StAR StorageMedia field (Optional)
             # too many e vars here below, wtf?
             ## Review
             # if endpoint.storagemedia:
-            #     e = etree.SubElement(rec, SR + "StorageMedia")
+            #     e = etree.SubElement(rec, _SR + "StorageMedia")
             #     e.text = endpoint.storagemedia
 
             # StAR StartTime field (Required)
-            e = etree.SubElement(rec, SR + "StartTime")
-            e.text = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(share.stats['starttime']))
+            e = etree.SubElement(rec, start_time_tag)
+            e.text = time.strftime(_STAR_TIME_FORMAT, time.gmtime(share.stats['starttime']))
 
             # StAR EndTime field (Required)
-            e = etree.SubElement(rec, SR + "EndTime")
-            e.text = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(share.stats['endtime']))
+            e = etree.SubElement(rec, end_time_tag)
+            e.text = time.strftime(_STAR_TIME_FORMAT, time.gmtime(share.stats['endtime']))
 
             # StAR FileCount field (Optional)
             if share.stats['filecount']:
-                e = etree.SubElement(rec, SR + "FileCount")
+                e = etree.SubElement(rec, file_count_tag)
                 e.text = str(share.stats['filecount'])
 
             # StAR ResourceCapacityUsed (Required)
-            e1 = etree.SubElement(rec, SR + "ResourceCapacityUsed")
+            e1 = etree.SubElement(rec, capacity_used_tag)
             e1.text = str(share.stats['bytesused'])
 
             # StAR ResourceCapacityAllocated (Optional)
-            e3 = etree.SubElement(rec, SR + "ResourceCapacityAllocated")
+            e3 = etree.SubElement(rec, capacity_allocated_tag)
             e3.text = str(share.stats['quota'])
 
             # if not endpoint.logicalcapacityused:
             #     endpoint.logicalcapacityused = 0
             #
-            # e2 = etree.SubElement(rec, SR + "LogicalCapacityUsed")
+            # e2 = etree.SubElement(rec, _SR + "LogicalCapacityUsed")
             # e2.text = str(endpoint.logicalcapacityused)
 
-            root = data.getroottree().getroot()
-            sub_element = copy.deepcopy(root[0])
-            xmlroot.append(sub_element)
-
-    return etree.tostring(xmlroot, pretty_print=True, encoding='unicode')
+    return xmlroot
 
 
 def process_rfc4331_response(response, storage_share):
@@ -201,18 +237,19 @@ def process_rfc4331_response(response, storage_share):
 
     """
     _tree = etree.fromstring(response.content)
-    _node = _tree.find('.//{DAV:}quota-available-bytes').text
+    _bytesused = _tree.findtext('.//{DAV:}quota-used-bytes')
+    _bytesfree = _tree.findtext('.//{DAV:}quota-available-bytes')
 
     # Check that we got the requested information. If not, then
     # the method is not supported.
-    if _node is None:
+    if not _bytesused or not _bytesfree:
         raise dynafed_storagestats.exceptions.ErrorDAVQuotaMethod(
             error="UnsupportedMethod"
         )
 
     # Assign the values returned by the endpoint.
-    storage_share.stats['bytesused'] = int(_tree.find('.//{DAV:}quota-used-bytes').text)
-    storage_share.stats['bytesfree'] = int(_tree.find('.//{DAV:}quota-available-bytes').text)
+    storage_share.stats['bytesused'] = int(_bytesused)
+    storage_share.stats['bytesfree'] = int(_bytesfree)
 
     # Determine which value to use for the quota.
     if storage_share.plugin_settings['storagestats.quota'] == 'api':